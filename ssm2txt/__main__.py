@@ -17,13 +17,15 @@ ssm2txt. If not, see <https://www.gnu.org/licenses/>.
 
 import argparse
 import os.path
-import xml.etree.ElementTree as ElementTree
-from ssm2txt.project import Project
-from ssm2txt.sf import SafetyFunction
-from ssm2txt.subsystem import Subsystem
-from ssm2txt.channel import Channel
-from ssm2txt.block import Block
-from ssm2txt.element import Element
+
+# Import lxml if available as it parses and searches the source document
+# significantly faster than the standard library implementation. The
+# ElementPath expressions used here are supported by both, so the standard
+# library serves as a functional fallback if lxml is not installed.
+try:
+    from lxml import etree as ElementTree
+except ImportError:
+    import xml.etree.ElementTree as ElementTree
 
 
 def get_args():
@@ -41,15 +43,39 @@ class SSM(object):
     """
 
     # Mapping of table_name attribute to the type of Node object that will
-    # be instantiated for each row.
-    tables = {
-        'projectops': Project,
-        'sfops': SafetyFunction,
-        'componentops': Subsystem,
-        'channelops': Channel,
-        'blocops': Block,
-        'elementops': Element
-    }
+    # be instantiated for each row; populated on first use by row_types().
+    tables = None
+
+    # Tables which do not yield nodes, but hold rows referenced from tab
+    # content, e.g., applied measures, and must be retained when parsing.
+    referenced_tables = frozenset(('ccfmeasureops', 'dcmeasureops'))
+
+    @classmethod
+    def row_types(cls):
+        """Acquires the mapping of table names to row object types.
+
+        The row modules are imported here, instead of at module level, so
+        they are only loaded when a document is actually processed, e.g.,
+        not for --help.
+        """
+        if cls.tables is None:
+            from ssm2txt.project import Project
+            from ssm2txt.sf import SafetyFunction
+            from ssm2txt.subsystem import Subsystem
+            from ssm2txt.channel import Channel
+            from ssm2txt.block import Block
+            from ssm2txt.element import Element
+
+            cls.tables = {
+                'projectops': Project,
+                'sfops': SafetyFunction,
+                'componentops': Subsystem,
+                'channelops': Channel,
+                'blocops': Block,
+                'elementops': Element
+            }
+
+        return cls.tables
 
     def __init__(self, filename):
         self.filename = filename
@@ -58,9 +84,22 @@ class SSM(object):
         self.prj = self.get_project(doc, nodes)
 
     def parse(self):
-        """Reads the ssm XML into an ElementTree document."""
-        tree = ElementTree.parse(self.filename)
-        return tree.getroot()
+        """Reads the ssm XML into an ElementTree document.
+
+        The document is parsed incrementally, discarding the content of
+        tables that contribute nothing to the output as soon as each is
+        complete, keeping peak memory proportional to the rows actually
+        used instead of the entire document.
+        """
+        keep = self.row_types().keys() | self.referenced_tables
+        context = ElementTree.iterparse(self.filename, events=('end',))
+
+        for event, element in context:
+            if (element.tag == 'table'
+                    and element.get('table_name') not in keep):
+                element.clear()
+
+        return context.root
 
     def read_tables(self, doc):
         """Loads all tables within the source document."""
@@ -68,11 +107,21 @@ class SSM(object):
         # given XML element.
         nodes = {}
 
-        for table in doc.iterfind('tables/table'):
+        # Index the tables by name in a single pass so each table, and the
+        # project row below, can be located without an XPath scan of the
+        # entire document.
+        # Tables dropped during parsing no longer carry a name, so get()
+        # is used; they simply collect under a None key. The tables parent
+        # is located once and its children iterated directly rather than
+        # evaluating an ElementPath expression.
+        self.table_index = {t.get('table_name'): t
+                            for t in doc.find('tables')}
+
+        for table_name, row_type in self.row_types().items():
             try:
-                row_type = self.tables[table.attrib['table_name']]
+                table = self.table_index[table_name]
 
-            # Ignore tables that don't have an assigned row object type.
+            # Ignore tables not present in the source document.
             except KeyError:
                 continue
 
@@ -82,14 +131,17 @@ class SSM(object):
 
     def read_nodes(self, table, row_type, nodes, doc):
         """Instantiates objects for rows in a given table."""
-        [row_type(row, nodes, doc) for row in table.iterfind('rows/*')]
+        # The rows parent is located once, and its children iterated
+        # directly, instead of evaluating a 'rows/*' path per table.
+        for row in table.find('rows'):
+            row_type(row, nodes, doc)
 
     def get_project(self, doc, nodes):
         """
         Locates the project object, which is the object associated with
         the first, and only row in the projectops table.
         """
-        element = doc.find("tables/table[@table_name='projectops']/rows/row")
+        element = self.table_index['projectops'].find('rows/row')
         return nodes[element.attrib['oid']]
 
     def __str__(self):
@@ -97,9 +149,19 @@ class SSM(object):
         return str(self.prj)
 
     def write(self):
-        """Writes the content to the output file."""
-        with open(self.output_filename, 'w', encoding='utf_8') as f:
-            f.write(str(self))
+        """Writes the content to the output file.
+
+        Content is streamed to the file one node at a time to avoid
+        holding the entire output document in memory. A large write
+        buffer keeps the many small blocks from translating into many
+        small system calls.
+        """
+        with open(self.output_filename, 'w', encoding='utf_8',
+                  buffering=1 << 20) as f:
+            for i, block in enumerate(self.prj.iter_content()):
+                if i:
+                    f.write('\n\n\n')
+                f.write(block)
 
     @property
     def output_filename(self):
@@ -109,9 +171,15 @@ class SSM(object):
         the extension changed to .txt.
         """
         root = os.path.splitext(self.filename)[0]
-        return '.'.join((root, 'txt'))
+        return f"{root}.txt"
+
+
+def main():
+    """Command-line entry point."""
+    args = get_args()
+    ssm = SSM(args.ssm)
+    ssm.write()
 
 
-args = get_args()
-ssm = SSM(args.ssm)
-ssm.write()
+if __name__ == '__main__':
+    main()
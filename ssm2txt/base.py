@@ -22,20 +22,27 @@ generated output can be easily correlated with the source project.
 
 
 import collections
+import concurrent.futures
+import functools
+import os
 
 
 class Base(object):
     """Base class for all sectioning types."""
 
+    # Slots are used for all sectioning types as a document may contain
+    # many thousands of node and tab instances; this reduces per-instance
+    # memory and speeds attribute access.
+    __slots__ = ('element', 'nodes', 'doc', 'oid')
+
     def __init__(self, element, nodes, doc):
         self.element = element
         self.nodes = nodes
         self.doc = doc
 
-    @property
-    def oid(self):
-        """The OID string assigned to this element."""
-        return self.element.attrib['oid']
+        # The OID string assigned to this element; read once here as it
+        # is consulted repeatedly for parent/child navigation.
+        self.oid = element.attrib['oid']
 
     @property
     def node(self):
@@ -53,34 +60,58 @@ class Node(Base):
     nodes.
     """
 
+    __slots__ = ('children', '_parent', '_path', '_tab_instances')
+
     # Characters used to draw the title block and project tree.
     BORDER_LEFT = chr(9553)
     BORDER_CORNER = chr(9562)
     BORDER_BOTTOM = chr(9552)
     TREE_BRANCH = chr(9492)
 
+    # Line closing out the title block; identical for every node, so it
+    # is built once here.
+    BORDER_END = BORDER_CORNER + BORDER_BOTTOM * 80
+
+    # Minimum number of children before their content is rendered in
+    # parallel; smaller families don't amortize the thread pool overhead.
+    PARALLEL_THRESHOLD = 8
+
+    # Name of the XML attribute holding the parent node's OID. Subclasses
+    # override this except for top-level nodes(project), which have no
+    # parent.
+    parent_attr = None
+
     def __init__(self, element, nodes, doc):
         super().__init__(element, nodes, doc)
         self.children = []
+
+        # Cache storage for the instantiated tabs; created on first use.
+        self._tab_instances = None
+
+        # Resolve the parent node once; the tree structure is static, so
+        # this avoids repeating the lookup every time the parent is
+        # consulted, e.g., when building paths.
+        self._parent = self.find_parent()
+
+        # Cache storage for get_path(); computed on first use.
+        self._path = None
+
         self.register_with_parent()
 
         # Add this object to the mapping of OIDs to node objects.
         nodes[self.oid] = self
 
-    @property
-    def parent(self):
+    def find_parent(self):
         """Locates the node one level above this one in the project tree."""
-        try:
-            parent_oid = self.element.attrib[self.parent_attr]
-
-        # Top-level nodes(project) do not have a parent_attr.
-        except AttributeError:
-            parent = None
+        if self.parent_attr is None:
+            return None
 
-        else:
-            parent = self.nodes[parent_oid]
+        return self.nodes[self.element.attrib[self.parent_attr]]
 
-        return parent
+    @property
+    def parent(self):
+        """The node one level above this one in the project tree."""
+        return self._parent
 
     def register_with_parent(self):
         """
@@ -98,17 +129,20 @@ class Node(Base):
 
     def get_path(self):
         """
-        Builds a list node names, starting from the root(project), and ending
-        at this node.
-        """
-        path = []
-
-        if self.parent is not None:
-            path.extend(self.parent.get_path())
+        Builds a tuple of node names, starting from the root(project), and
+        ending at this node.
 
-        path.append(self.tree_title)
+        The result is cached, and built by extending the parent's cached
+        path, so each node's title is only generated once regardless of
+        how many descendants include it in their own paths.
+        """
+        if self._path is None:
+            if self._parent is None:
+                self._path = (self.tree_title,)
+            else:
+                self._path = self._parent.get_path() + (self.tree_title,)
 
-        return path
+        return self._path
 
     @property
     def tree_title(self):
@@ -125,11 +159,8 @@ class Node(Base):
         Creates the identifier shown in square brackets, if the node defined
         a non-emtpy reference identifier.
         """
-        try:
-            id = self.element.attrib['equipmentid']
-        except KeyError:
-            id = ''
-        return "[{0}]".format(id) if len(id) > 0 else None
+        id = self.element.get('equipmentid', '')
+        return f"[{id}]" if len(id) > 0 else None
 
     @property
     def name(self):
@@ -142,21 +173,8 @@ class Node(Base):
     def path_str(self):
         """Generates a string depicting this node's position in the project."""
         path = self.get_path()
-        lines = []
-        for i in range(len(path)):
-            fields = [self.BORDER_LEFT, ' ']
-            fields.append(' ' * i) # Add indentation.
-
-            # Add a tree branch for every node but the first.
-            if i:
-                fields.append(self.TREE_BRANCH)
-
-            fields.append(path[i]) # Add node path(acronym & name).
-
-            lines.append(''.join(fields))
-
-        lines.append(''.join((self.BORDER_CORNER, self.BORDER_BOTTOM * 80)))
-
+        lines = [_tree_prefix(i) + path[i] for i in range(len(path))]
+        lines.append(self.BORDER_END)
         return '\n'.join(lines)
 
     def __str__(self):
@@ -164,18 +182,50 @@ class Node(Base):
         Builds a string containing the all the content for this node and
         all children.
         """
-        lines = []
+        return '\n\n\n'.join(self.iter_content())
+
+    def iter_content(self):
+        """
+        Yields content blocks for this node, followed by those of all
+        children.
+
+        Generating output one block at a time allows the caller to stream
+        content directly to the output file rather than materializing the
+        entire document as a single string.
+        """
+        empty = True
 
         # Include content for this node only if it has any defined tabs,
         # i.e., some node types are structural only and don't have any content
         # of their own.
         if self.tabs:
-            lines.append(self.get_content())
+            empty = False
+            yield self.get_content()
+
+        # Recursively include child content. Subtrees are independent of
+        # one another, so nodes with many children render them
+        # concurrently; blocks are still yielded in child order.
+        if len(self.children) >= self.PARALLEL_THRESHOLD:
+            workers = os.cpu_count()
+            with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+                child_blocks = pool.map(lambda c: list(c.iter_content()),
+                                        self.children)
+                for blocks in child_blocks:
+                    for block in blocks:
+                        empty = False
+                        yield block
 
-        # Recursively include child content.
-        lines.extend([str(child) for child in self.children])
+        else:
+            for child in self.children:
+                for block in child.iter_content():
+                    empty = False
+                    yield block
 
-        return '\n\n\n'.join(lines)
+        # A node yielding nothing at all still contributes a single empty
+        # block, preserving the separator its parent places between
+        # siblings.
+        if empty:
+            yield ''
 
     def get_content(self):
         """
@@ -192,11 +242,96 @@ class Node(Base):
 
     def get_tab_content(self):
         """Generates a string containing content output by all tabs."""
-        instances = [t(self.element, self.nodes, self.doc) for t in self.tabs]
-        content = [str(i) for i in instances]
+        if self._tab_instances is None:
+            self._tab_instances = [t(self.element, self.nodes, self.doc)
+                                   for t in self.tabs]
+
+        content = [str(i) for i in self._tab_instances]
         return '\n\n'.join(content)
 
 
+@functools.lru_cache(maxsize=None)
+def _tree_prefix(depth):
+    """Builds the prefix drawn before a node title in the project tree.
+
+    The prefix depends only on depth, so it is cached and shared by
+    every node at the same level.
+    """
+    prefix = ''.join((Node.BORDER_LEFT, ' ', ' ' * depth))
+
+    # Add a tree branch for every node but the first.
+    if depth:
+        prefix += Node.TREE_BRANCH
+
+    return prefix
+
+
+# Named-tuple holding the per-document lookup indexes built by doc_index():
+#
+# tables - Mapping of table_name to the table element.
+#
+# rows - Mapping of row OID to the row element, across all retained tables.
+DocIndex = collections.namedtuple('DocIndex', ['tables', 'rows'])
+
+# Cache of DocIndex instances keyed by document id.
+_doc_indexes = {}
+
+
+def doc_index(doc):
+    """Acquires the lookup indexes for a given source document.
+
+    The document is scanned once on first use, providing all tab classes
+    a common means of locating tables and referenced rows without
+    repeated document walks.
+    """
+    try:
+        return _doc_indexes[id(doc)]
+
+    except KeyError:
+        pass
+
+    tables = {}
+    rows = {}
+
+    for table in doc.find('tables'):
+        tables[table.get('table_name')] = table
+
+        rows_parent = table.find('rows')
+        if rows_parent is not None:
+            for row in rows_parent:
+                rows[row.get('oid')] = row
+
+    index = DocIndex(tables, rows)
+    _doc_indexes[id(doc)] = index
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _csv_to_int(csv):
+    """Converts a comma-separated list of options to integer keys.
+
+    Condition checklists repeat across nodes, so the parsed result is
+    cached on the raw string.
+    """
+    try:
+        return tuple(int(opt.strip()[-2:]) for opt in csv.split(','))
+
+    # Handle an empty csv strig where split() returns a list containing
+    # an empty string.
+    except ValueError:
+        return ()
+
+
+@functools.lru_cache(maxsize=None)
+def _percent(s):
+    """Converts a string floating-point value into a percentage.
+
+    DC and RDF values repeat heavily across a project, so the conversion
+    result is cached on the raw string.
+    """
+    return str(float(s) * 100)
+
+
 class Tab(Base):
     """Container for a set of related fields.
 
@@ -205,6 +340,8 @@ class Tab(Base):
     Documentation or MTTFD.
     """
 
+    __slots__ = ('parent',)
+
     # Define a named-tuple to hold the various properties defining a field
     # displaying a single parameter.
     field_names = [
@@ -233,107 +370,146 @@ class Tab(Base):
 
     Field = collections.namedtuple('Field', field_names, defaults=[None])
 
+    # Named-tuple holding a field along with the methods it may dispatch
+    # to, resolved ahead of time at class creation:
+    #
+    # method - The value method named by attrib, or None if the value
+    #          comes directly from an XML attribute.
+    #
+    # formatter - The format_<attrib> method, or None if the raw value is
+    #             output unaltered.
+    #
+    # show - The function underlying the named show property, or None if
+    #        the field is always included.
+    ResolvedField = collections.namedtuple(
+        'ResolvedField',
+        ['title', 'attrib', 'method', 'formatter', 'show'])
+
     # Unicode characters used to draw the title box.
     BORDER_LEFT = chr(9474)
     BORDER_CORNER = chr(9492)
     BORDER_BOTTOM = chr(9472)
 
-    # Translations for PL values other than the normal a-e.
-    pl_other = {
+    # Translations for PL attribute values. The attribute alphabet is
+    # fixed, so every result is precomputed here rather than derived by
+    # string slicing per access.
+    pl_table = {
+        'plA': 'a',
+        'plB': 'b',
+        'plC': 'c',
+        'plD': 'd',
+        'plE': 'e',
         'plN': '-',
         'plU': 'n.a.'
     }
 
-    @property
-    def parent(self):
-        """Acquires the Node object owning this tab."""
-        return self.nodes[self.element.attrib['oid']]
-
-    def __str__(self):
-        """Generates all output associated with this tab."""
-        lines = []
+    # Translations for category attribute values.
+    cat_table = {
+        'catB': 'B',
+        'cat1': '1',
+        'cat2': '2',
+        'cat3': '3',
+        'cat4': '4',
+        'catN': 'Unknown'
+    }
 
-        # Add title.
-        lines.append(' '.join((self.BORDER_LEFT, type(self).__name__)))
-        lines.append(''.join((self.BORDER_CORNER, self.BORDER_BOTTOM * 40)))
+    def __init_subclass__(cls, **kwargs):
+        """Precomputes per-class constants derived from the field list.
 
-        # Add fields.
-        lines.append(self.get_field_content())
+        The raw field tuples never change for a given subclass, so they are
+        translated into Field named-tuples once here instead of on every
+        render.
+        """
+        super().__init_subclass__(**kwargs)
 
-        return '\n'.join(lines)
+        # The title block depends only on the class name, so it is built
+        # here instead of with every render.
+        cls.title_block = '\n'.join((
+            ' '.join((cls.BORDER_LEFT, cls.__name__)),
+            cls.BORDER_CORNER + cls.BORDER_BOTTOM * 40))
 
-    def get_field_content(self):
-        """Generates a string containing the content from all fields."""
-        lines = []
+        try:
+            fields = cls.fields
 
-        # Translate the raw tuples into Field named-tuples, making
-        # identifying each item easier and supplying default values.
-        instances = [self.Field(*f) for f in self.fields]
+        # The field list is not required, e.g., intermediate subclasses.
+        except AttributeError:
+            return
 
-        for field in [i for i in instances if self.show_field(i)]:
-            value = self.field_value(field.attrib)
+        cls.field_instances = tuple(cls.Field(*f) for f in fields)
+        cls.resolved_fields = tuple(cls.resolve_field(f)
+                                    for f in cls.field_instances)
 
-            if field.title:
-                lines.append("{0}: {1}".format(field.title, value))
-            else:
-                lines.append(value)
+    @classmethod
+    def resolve_field(cls, field):
+        """Resolves the methods a field may dispatch to.
 
-        return '\n'.join(lines)
+        The value and formatting methods are fixed for a given subclass,
+        so they are looked up once here, removing the per-field
+        hasattr/getattr dispatch from the render loop.
+        """
+        method = getattr(cls, field.attrib, None)
+        formatter = getattr(cls, '_'.join(('format', field.attrib)), None)
 
-    def show_field(self, field):
-        """Determines if a field should be output.
+        # Resolve the named show filter, normally defined as a property,
+        # down to its underlying function.
+        show = getattr(cls, field.show) if field.show is not None else None
+        if isinstance(show, property):
+            show = show.fget
 
-        This is based on two conditions:
+        return cls.ResolvedField(field.title, field.attrib, method,
+                                 formatter, show)
 
-        1. The field's attrib must name an existing source XML element
-           attribute or a method from which the value can be sourced.
+    def __init__(self, element, nodes, doc):
+        super().__init__(element, nodes, doc)
 
-        2. If the field contains a show, the property identified by that
-           string returns True.
-        """
-        # Check if the given attribute or value method exists.
-        try:
-            self.element.attrib[field.attrib]
-            exists = True
-        except KeyError:
-            exists = hasattr(self, field.attrib)
-
-        # Check the show property, defaulting to include the content if
-        # a property was not defined.
-        if field.show is None:
-            show = True
-        else:
-            show = getattr(self, field.show)
+        # Resolve the Node object owning this tab once; tabs are only
+        # constructed after every node exists.
+        self.parent = nodes[self.oid]
 
-        return exists and show
+    def __str__(self):
+        """Generates all output associated with this tab."""
+        return '\n'.join((self.title_block, self.get_field_content()))
 
-    def field_value(self, attrib):
-        """Acquires the string to be printed as the field's value.
+    def get_field_content(self):
+        """Generates a string containing the content from all fields.
 
-        The attribute's raw value or method return value is output by
-        default. The value can be altered if the instance defines a
-        format_<attrib> method, in which case the return value is used
-        as the output string.
+        A field is output if its attrib names an existing source XML
+        attribute or a resolved value method, and its show property, if
+        defined, returns True. The XML attribute takes priority as the
+        value source, and the raw value is passed through the resolved
+        format_<attrib> method if one exists.
         """
-        # See if the XML attribute exists.
-        try:
-            raw_value = self.element.attrib[attrib]
+        lines = []
+        attribs = self.element.attrib
 
-        # Revert to a method if the XML attribute does not exist.
-        except KeyError:
-            method = getattr(self, attrib)
-            raw_value = method()
+        for field in self.resolved_fields:
+            # Check the show filter, defaulting to include the content
+            # if one was not defined.
+            if field.show is not None and not field.show(self):
+                continue
 
-        try:
-            formatter = getattr(self, '_'.join(('format', attrib)))
+            raw_value = attribs.get(field.attrib)
 
-        except AttributeError:
-            value = raw_value
+            # Revert to the value method if the XML attribute does not
+            # exist, excluding the field if neither is available.
+            if raw_value is None:
+                if field.method is None:
+                    continue
+                raw_value = field.method(self)
 
-        else:
-            value = formatter(raw_value)
+            if field.formatter is None:
+                value = raw_value
+            else:
+                value = field.formatter(self, raw_value)
 
-        return self.replace_newline(value)
+            value = self.replace_newline(value)
+
+            if field.title:
+                lines.append(f"{field.title}: {value}")
+            else:
+                lines.append(value)
+
+        return '\n'.join(lines)
 
     def replace_newline(self, raw):
         """Converts the new line control sequence to an actual newline.
@@ -354,12 +530,11 @@ class Tab(Base):
         there are no attributes that are just 'pl'; this is used by actual
         formatting methods that need to normalize PL values.
         """
-        # First, see if it's one of the non-alpha values.
-        try:
-            pl = self.pl_other[raw]
+        pl = self.pl_table.get(raw)
 
-        # Normal PL values strip the 'pl' prefix and convert to lower-case.
-        except KeyError:
+        # Values outside the table strip the 'pl' prefix and convert to
+        # lower-case.
+        if pl is None:
             pl = raw[-1].lower()
 
         return pl
@@ -370,15 +545,13 @@ class Tab(Base):
         integer attributes: 0 or 1. The given argument can be either
         an attribute name or the raw value.
         """
-        # Use an attribute if it exists.
-        try:
-            i = int(self.element.attrib[s])
-
-        # Otherwise, convert the given value directly.
-        except KeyError:
-            i = int(s)
+        # Use an attribute if it exists, otherwise convert the given
+        # value directly.
+        value = self.element.get(s)
+        if value is None:
+            value = s
 
-        return i > 0
+        return int(value) > 0
 
     def csv_to_int(self, csv):
         """
@@ -387,24 +560,21 @@ class Tab(Base):
         in each option. This method strips the prefix, and converts each
         option to its equivalent integer.
         """
-        try:
-            return [int(opt.strip()[-2:]) for opt in csv.split(',')]
-
-        # Handle an empty csv strig where split() returns a list containing
-        # an empty string.
-        except ValueError:
-            return []
+        return _csv_to_int(csv)
 
     def percent(self, s):
         """
         Converts a string representing a floating-point value, typically 0-1,
         into a percentage.
         """
-        return str(float(s) * 100)
+        return _percent(s)
 
     def format_cat(self, raw):
         """Formatter for category fields."""
-        value = raw[-1]
-        if value == 'N':
-            value = 'Unknown'
+        value = self.cat_table.get(raw)
+
+        # Values outside the table strip the 'cat' prefix.
+        if value is None:
+            value = raw[-1]
+
         return value
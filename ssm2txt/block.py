@@ -22,18 +22,14 @@ the project tree.
 from ssm2txt.base import Node
 from ssm2txt.dc import DC
 from ssm2txt.doc import Documentation
-import ssm2txt.mttfd as mttfd
-
-
-class MTTFD(mttfd.MTTFD):
-    """The MTTFD tab."""
-
-    child_type = 'elements'
+from ssm2txt.mttfd import MTTFD
 
 
 class Block(Node):
     """Generates output for blocks."""
 
+    __slots__ = ()
+
     acronym = 'BL'
     parent_attr = 'parentopoid'
     tabs = [Documentation, MTTFD, DC]
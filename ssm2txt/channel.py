@@ -29,6 +29,8 @@ class Channel(Node):
     unit.
     """
 
+    __slots__ = ()
+
     parent_attr = 'componentopoid'
     tabs = []
 
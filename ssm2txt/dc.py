@@ -19,11 +19,13 @@ and elements.
 """
 
 
-from ssm2txt.base import Tab
+from ssm2txt.base import (Tab, doc_index)
 
 
 class DC(Tab):
 
+    __slots__ = ()
+
     fields = [
         (None, 'dcdet'),
 
@@ -71,28 +73,39 @@ class DC(Tab):
 
     def get_measure_element(self, oid):
         """Locates the element defining the selected DC measure."""
-        path = "tables/table/rows/row[@oid='{0}']".format(oid)
-        return self.doc.find(path)
+        return doc_index(self.doc).rows[oid]
 
     def measures_dc(self, title, element, attrib):
         """Generates a DC percentage field from a measure attribute."""
         return "{0}: {1}".format(title, self.percent(element.attrib[attrib]))
 
+    # Cache of formatted insufficient-PL lists keyed by the raw attribute
+    # string. Measures, and therefore their PL lists, are shared across
+    # many blocks and elements.
+    insufficient_pl_cache = {}
+
     def insufficient_pl(self, measure):
         """
         Converts the insufficient PLs attribute to a comma-separated
         list of performance levels.
         """
+        raw = measure.get('insufficientpls', '')
+
         try:
-            pls = [self.format_pl(pl)
-                   for pl in measure.attrib['insufficientpls'].split(',')]
+            return self.insufficient_pl_cache[raw]
+
+        except KeyError:
+            pass
 
-        # Handle an empty source string case where split returns a list
-        # with an empty string instead of an empty list.
-        except IndexError:
-            pls = []
+        # An empty source string is checked explicitly because split()
+        # returns a list containing an empty string, not an empty list.
+        if raw:
+            value = ', '.join([self.format_pl(pl) for pl in raw.split(',')])
+        else:
+            value = ''
 
-        return ', '.join(pls)
+        self.insufficient_pl_cache[raw] = value
+        return value
 
     def format_dc(self, raw):
         """Formatter for the Diagnostic coverage field."""
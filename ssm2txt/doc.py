@@ -19,11 +19,33 @@ and elements.
 """
 
 
+import functools
+
 from ssm2txt.base import Tab
 
 
+@functools.lru_cache(maxsize=None)
+def _format_functiontypes(raw):
+    """Formats the set of function checkboxes.
+
+    The same combinations recur across many nodes, so the split/sort
+    result is cached on the raw attribute string.
+    """
+    funcs = [f[3:] for f in raw.split(',')] # Strip the 'fnc' prefix.
+    funcs.sort() # Display order is also alphabetic.
+    return ', '.join(funcs)
+
+
+@functools.lru_cache(maxsize=None)
+def _format_technology(raw):
+    """Formats a technology value, which repeats across many nodes."""
+    return raw[3:].lower()
+
+
 class Documentation(Tab):
 
+    __slots__ = ()
+
     fields = [
         (None, 'name'),
         ('Reference designator', 'equipmentid'),
@@ -53,11 +75,9 @@ class Documentation(Tab):
                                          raw)
 
     def format_functiontypes(self, raw):
-        """Formats the set of function checkboxes."""
-        funcs = [f[3:] for f in raw.split(',')] # Strip the 'fnc' prefix.
-        funcs.sort() # Display order is also alphabetic.
-        return ', '.join(funcs)
+        """Formatter for the set of function checkboxes."""
+        return _format_functiontypes(raw)
 
     def format_technology(self, raw):
         """Formatter for the technology field."""
-        return raw[3:].lower()
+        return _format_technology(raw)
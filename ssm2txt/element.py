@@ -22,18 +22,14 @@ of the project tree.
 from ssm2txt.base import Node
 from ssm2txt.dc import DC
 from ssm2txt.doc import Documentation
-import ssm2txt.mttfd as mttfd
-
-
-class MTTFD(mttfd.MTTFD):
-    """The MTTFD tab."""
-
-    child_type = None
+from ssm2txt.mttfd import MTTFD
 
 
 class Element(Node):
     """Generates output for elements."""
 
+    __slots__ = ()
+
     acronym = 'EL'
     parent_attr = 'parentopoid'
     tabs = [Documentation, MTTFD, DC]
@@ -24,6 +24,8 @@ from ssm2txt.base import Tab
 
 class MTTFD(Tab):
 
+    __slots__ = ('_fault_exclusion',)
+
     fields = [
         (None, 'mttfddet'),
         ('MTTFD', 'mttfd'),
@@ -50,6 +52,13 @@ class MTTFD(Tab):
         ('Mission time', 'missiontime')
     ]
 
+    # Mapping of the parent node's acronym to the term naming the child
+    # nodes an MTTFD value can be determined from.
+    child_types = {
+        'SB': 'blocks',
+        'BL': 'elements'
+    }
+
     # Mapping for the MTTFD determination method.
     det_methods = {
         'detSubItems': 'Determine MTTFD value from {0}',
@@ -64,6 +73,16 @@ class MTTFD(Tab):
         'calcB10dDirect': 'B10D'
         }
 
+    @property
+    def child_type(self):
+        """The type of child node an MTTFD value may be derived from.
+
+        This is a function of the owning node type, which allows the
+        same tab class to serve subsystems, blocks, and elements; None
+        for elements, which have no children.
+        """
+        return self.child_types.get(self.parent.acronym)
+
     def format_mttfddet(self, raw):
         """Formatter for the MTTFD determination method."""
         return self.det_methods[raw].format(self.child_type)
@@ -106,11 +125,21 @@ class MTTFD(Tab):
         else:
             return raw
 
+    def __init__(self, element, nodes, doc):
+        super().__init__(element, nodes, doc)
+
+        # Cache storage for fault_exclusion; converted on first use.
+        self._fault_exclusion = None
+
     @property
     def fault_exclusion(self):
         """Logical state of the fault exclusion checkbox.
 
         This field doesn't have a dedicated attribute, but is derived from
-        the mttfd value.
+        the mttfd value. The conversion is cached as the state is queried
+        by multiple fields per render.
         """
-        return float(self.element.attrib['mttfd']) < 0
+        if self._fault_exclusion is None:
+            self._fault_exclusion = float(self.element.attrib['mttfd']) < 0
+
+        return self._fault_exclusion
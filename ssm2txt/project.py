@@ -25,6 +25,8 @@ from ssm2txt.base import (Node, Tab)
 class Documentation(Tab):
     """The project's Documentation tab."""
 
+    __slots__ = ()
+
     title = 'Documentation'
     fields = [
         ('Project name', 'name'),
@@ -46,5 +48,7 @@ class Documentation(Tab):
 class Project(Node):
     """The project node itself."""
 
+    __slots__ = ()
+
     acronym = 'PR'
     tabs = [Documentation]
@@ -25,6 +25,8 @@ from ssm2txt.base import (Node, Tab)
 class Documentation(Tab):
     """Output for the Documentation tab."""
 
+    __slots__ = ()
+
     fields = [
         ('Name of safety function', 'name'),
         ('Type of safety function', 'sftype'),
@@ -43,6 +45,8 @@ class Documentation(Tab):
 class PLr(Tab):
     """Output for the PLr tab."""
 
+    __slots__ = ()
+
     fields = [
         (None, 'plrdet'),
 
@@ -73,30 +77,38 @@ class PLr(Tab):
         '1': '1'
         }
 
+    # Complete translations per risk parameter, built once so each
+    # formatter is a single dictionary lookup instead of a join.
+    risk_params_s = {k: 'S' + v for k, v in risk_params.items()}
+    risk_params_f = {k: 'F' + v for k, v in risk_params.items()}
+    risk_params_p = {k: 'P' + v for k, v in risk_params.items()}
+
     def format_plrdet(self, value):
         """Formatting function for the determination method selection."""
         return self.det_selections[value]
 
-    def format_plr(self, value):
-        """Formatting function for the PLr parameter."""
-        return self.format_pl(value)
+    # The PLr parameter is a plain PL value; the shared formatter is
+    # aliased directly rather than delegated to through a wrapper call.
+    format_plr = Tab.format_pl
 
     def format_riskparams(self, value):
         """Formatting function for the severity risk parameter."""
-        return ''.join(('S', self.risk_params[value]))
+        return self.risk_params_s[value]
 
     def format_riskparamf(self, value):
         """Formatting function for the frequency risk parameter."""
-        return ''.join(('F', self.risk_params[value]))
+        return self.risk_params_f[value]
 
     def format_riskparamp(self, value):
         """Formatting function for the avoidance possibility risk parameter."""
-        return ''.join(('P', self.risk_params[value]))
+        return self.risk_params_p[value]
 
 
 class SafetyFunction(Node):
     """Generates output for safety function tree nodes."""
 
+    __slots__ = ()
+
     acronym = 'SF'
     parent_attr = 'projectopoid'
     tabs = [Documentation, PLr]
@@ -19,7 +19,7 @@ subsystem level of the project tree.
 """
 
 
-from ssm2txt.base import (Node, Tab)
+from ssm2txt.base import (Node, Tab, doc_index)
 import ssm2txt.doc as doc
 import ssm2txt.mttfd as mttfd
 
@@ -27,6 +27,8 @@ import ssm2txt.mttfd as mttfd
 class Documentation(doc.Documentation):
     """The Documentation tab."""
 
+    __slots__ = ()
+
     @property
     def show_cat(self):
         """
@@ -39,6 +41,8 @@ class Documentation(doc.Documentation):
 class PL(Tab):
     """The subsystem PL tab."""
 
+    __slots__ = ('_pfhd_linked', '_pl_attrib', '_sil_attrib')
+
     fields = [
         (None, 'pldet'),
         ('Performance Level', 'pl'),
@@ -59,17 +63,33 @@ class PL(Tab):
         'detSubItemsSimple': 'Determine PL/PFHD from Category and DCavg',
     }
 
-    # Mapping for the PLReqXX conditions to their respective text, keyed by
-    # the lasted two characters converted to an integer.
-    conditions = {
-        1: 'Behaviour of the safety function under fault conditions',
-        2: 'safety-related software according to clause 4.6 or no software included',
-        3: 'systematic failure',
-        4: 'Ability to perform a safety function under expected environmental conditions',
-        5: 'subsystem is the output part of the SRP/CS',
-        6: 'subsystem consists of mechanical, hydraulic or pneumatic components',
-        7: 'no application-specific reliability data are available for the components'
-    }
+    # Translations for the PLReqXX conditions, indexed by the last two
+    # characters converted to an integer. Index 0 is unused padding so
+    # the keys index the tuple directly.
+    conditions = (
+        None,
+        'Behaviour of the safety function under fault conditions',
+        'safety-related software according to clause 4.6 or no software included',
+        'systematic failure',
+        'Ability to perform a safety function under expected environmental conditions',
+        'subsystem is the output part of the SRP/CS',
+        'subsystem consists of mechanical, hydraulic or pneumatic components',
+        'no application-specific reliability data are available for the components'
+    )
+
+    def __init__(self, element, nodes, doc):
+        super().__init__(element, nodes, doc)
+
+        # The PL/SIL-PFHD link state steers several fields, so it is
+        # converted once here instead of per access, along with the
+        # source attribute names it selects.
+        self._pfhd_linked = self.int_to_bool('isplpfhbind')
+        if self._pfhd_linked:
+            self._pl_attrib = 'pldirectbindcal'
+            self._sil_attrib = 'sildirectbindcal'
+        else:
+            self._pl_attrib = 'pldirectnobind'
+            self._sil_attrib = 'sildirectnobind'
 
     def format_pldet(self, value):
         """Formatting method for the selected method to determine PL."""
@@ -79,9 +99,9 @@ class PL(Tab):
         """Formatting method for the SIL/PL-PFHD checkbox."""
         return str(self.pfhd_linked)
 
-    def format_pldirectsoftware(self, raw):
-        """Formatting method for the software PL."""
-        return self.format_pl(raw)
+    # The software PL is a plain PL value; the shared formatter is
+    # aliased directly rather than delegated to through a wrapper call.
+    format_pldirectsoftware = Tab.format_pl
 
     def format_plconditions(self, value):
         """
@@ -96,8 +116,7 @@ class PL(Tab):
         Generates the performance level, which is sourced from different
         attributes based on the PL/PFHD link option.
         """
-        attrib = 'pldirectbindcal' if self.pfhd_linked else 'pldirectnobind'
-        raw = self.element.attrib[attrib]
+        raw = self.element.attrib[self._pl_attrib]
         return self.format_pl(raw)
 
     def sil(self):
@@ -105,10 +124,8 @@ class PL(Tab):
         Generates the SIL value, which is sourced from different attributes
         based on the SIL/PFHD link option.
         """
-        attrib = 'sildirectbindcal' if self.pfhd_linked else 'sildirectnobind'
-
         # Strip the 'sil' prefix.
-        raw = self.element.attrib[attrib][-1]
+        raw = self.element.attrib[self._sil_attrib][-1]
 
         # Convert the non-numeric option to '-'.
         value = '-' if raw == 'N' else raw
@@ -118,12 +135,14 @@ class PL(Tab):
     @property
     def pfhd_linked(self):
         """Returns the state of the checkbox linking SIL/PL to PFHD."""
-        return self.int_to_bool('isplpfhbind')
+        return self._pfhd_linked
 
 
 class Category(Tab):
     """The subsystem Category tab."""
 
+    __slots__ = ()
+
     fields = [
         ('Category of subsystem', 'cat'),
         ('Reduced test frequency', 'reducedtestingrate'),
@@ -133,17 +152,22 @@ class Category(Tab):
         ('File', 'catstandardfile')
     ]
 
-    # Mapping from the CATReqXX requirements to their respective text, keyed
-    # by the numeric suffix, e.g. CATReq06 is 6.
-    requirements = {
-        1: 'Basic safety principles are being used.',
-        2: 'Well-tried components are being used.',
-        3: 'Well-tried safety principles are being used.',
-        4: 'A single fault tolerance and reasonable fault detection are given.',
-        5: 'Accumulation of faults does not lead to a loss of the safety function.',
-        6: 'The requirements for the test frequency are satisfied.',
-        10: 'Accordance with relevant standards to withstand the expected influences.'
-    }
+    # Translations for the CATReqXX requirements, indexed by the numeric
+    # suffix, e.g. CATReq06 is 6. Unassigned suffixes hold None padding
+    # so the keys index the tuple directly.
+    requirements = (
+        None,
+        'Basic safety principles are being used.',
+        'Well-tried components are being used.',
+        'Well-tried safety principles are being used.',
+        'A single fault tolerance and reasonable fault detection are given.',
+        'Accumulation of faults does not lead to a loss of the safety function.',
+        'The requirements for the test frequency are satisfied.',
+        None,
+        None,
+        None,
+        'Accordance with relevant standards to withstand the expected influences.'
+    )
 
     def format_reducedtestingrate(self, raw):
         """Formatter for the reduced test frequency checkbox parameter."""
@@ -163,15 +187,11 @@ class Category(Tab):
         return '\n'.join(lines)
 
 
-class MTTFD(mttfd.MTTFD):
-    """The subsystem MTTFD tab."""
-
-    child_type = 'blocks'
-
-
 class DCavg(Tab):
     """The subsystem DCavg tab."""
 
+    __slots__ = ()
+
     fields = [
         (None, 'dcavgdet'),
         ('Diagnostic coverage', 'dcavg'),
@@ -195,6 +215,8 @@ class DCavg(Tab):
 class CCF(Tab):
     """The subsystem CCF tab."""
 
+    __slots__ = ()
+
     fields = [
         (None, 'ccfscoredet'),
         (None, 'list_measures'),
@@ -213,36 +235,52 @@ class CCF(Tab):
         """Formatter for the CCF method selection."""
         return self.detect[value]
 
+    # Template generating the output for a single applied measure,
+    # expanded directly from the row's attributes.
+    measure_template = '\n'.join((
+        'Type: {heading}',
+        'Measure: {description}',
+        'Points: {score}'))
+
     def list_measures(self):
         """Generates the list of applied measures.
 
         These items are not in the subsystem element, but come from the
         ccfmeasureops table.
         """
-        lines = []
-        fields = [
-            ('Type', 'heading'),
-            ('Measure', 'description'),
-            ('Points', 'score')
-        ]
-        for e in self.get_measures_elements():
-            lines.extend([": ".join((title, e.attrib[attrib]))
-                          for title, attrib in fields])
-        return '\n'.join(lines)
+        return '\n'.join([self.measure_template.format_map(e.attrib)
+                          for e in self.get_measures_elements()])
+
+    # Cache of measure rows bucketed by subsystem OID, keyed by source
+    # document id. The ccfmeasureops table is scanned once per document
+    # instead of once per subsystem.
+    measure_indexes = {}
 
     def get_measures_elements(self):
         """
         Acquires the list of rows in the ccfmeasureops table that point
         back to this node via the componentopoid attribute.
         """
-        path = "tables/table[@table_name='ccfmeasureops']/" \
-            "rows/row[@componentopoid='{0}']".format(self.oid)
-        return self.doc.findall(path)
+        try:
+            index = self.measure_indexes[id(self.doc)]
+
+        # Build the index on first use for this document.
+        except KeyError:
+            index = {}
+            table = doc_index(self.doc).tables.get('ccfmeasureops')
+            if table is not None:
+                for row in table.find('rows'):
+                    index.setdefault(row.get('componentopoid'), []).append(row)
+            self.measure_indexes[id(self.doc)] = index
+
+        return index.get(self.oid, [])
 
 
 class Subsystem(Node):
     """Generates output for subsystem nodes of the project tree."""
 
+    __slots__ = ()
+
     acronym = 'SB'
     parent_attr = 'sfopoid'
-    tabs = [Documentation, PL, Category, MTTFD, DCavg, CCF]
+    tabs = [Documentation, PL, Category, mttfd.MTTFD, DCavg, CCF]